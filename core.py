@@ -1,5 +1,7 @@
 from maya import cmds, mel
+import itertools
 import json
+import numbers
 import os
 import random
 import string
@@ -40,6 +42,10 @@ def f_attr(node, attr):
     return '{0}.{1}'.format(node, attr)
 
 
+def list_attributes(node):
+    return (cmds.listAttr(node, cb=True) or list()) + (cmds.listAttr(node, k=True) or list())
+
+
 def select(items):
     result = list()
     for item in items:
@@ -279,6 +285,185 @@ class Attribute(object):
         mel.eval('CBdeleteConnection "{0}";'.format(self.get_name()))
 
 
+# One json record per line, sorted by node then attribute, so two snapshots
+# can be compared in a single merge pass without loading either in memory.
+class SnapshotFile(object):
+    added = 'added'
+    removed = 'removed'
+    fields = ('type', 'value', 'locked', 'source', 'destination')
+
+    def __init__(self, path):
+        if not self.is_one(path):
+            cmds.error('\'{0}\' is not a valid {1}.'.format(path, self.__class__.__name__))
+        self.__path = path
+
+    @classmethod
+    def is_one(cls, path):
+        location = path.split('/')
+        location.pop()
+        return os.path.isdir('/'.join(location))
+
+    @classmethod
+    def iter_scene(cls, nodes):
+        for node in sorted(set(nodes)):
+            if not cmds.objExists(node):
+                cmds.warning('Unable to find \'{0}\' in the scene. Therefore it cannot be exported.'.format(node))
+                continue
+            for record in cls.iter_node(node):
+                yield record
+
+    @classmethod
+    def iter_node(cls, node):
+        source_connections = cls.get_connections(node, source=True, destination=False)
+        destination_connections = cls.get_connections(node, source=False, destination=True)
+        for attr in sorted(set(list_attributes(node))):
+            full = f_attr(node, attr)
+            # Queried directly rather than through Attribute, whose constructor runs objExists once more per plug.
+            if not cmds.objExists(full):
+                continue
+            value = cmds.getAttr(full)
+            record = [
+                node,
+                attr,
+                cmds.getAttr(full, type=True),
+                value if value is not None else '',
+                cmds.getAttr(full, lock=True),
+                sorted(source_connections.get(attr, list())),
+                sorted(destination_connections.get(attr, list())),
+            ]
+            # Round trip so tuples returned by getAttr compare equal to what is read back.
+            yield json.loads(json.dumps(record))
+
+    @classmethod
+    def get_connections(cls, node, source, destination):
+        connections = dict()
+        plugs = cmds.listConnections(
+            node, connections=True, plugs=True, source=source, destination=destination, skipConversionNodes=True
+        ) or list()
+        for own, other in zip(plugs[::2], plugs[1::2]):
+            # A connection to a compound such as translate also drives its children such as translateX.
+            for attr in cls.get_covered_attributes(node, cmds.attributeName(own, long=True)):
+                connections.setdefault(attr, list()).append(other)
+        return connections
+
+    @classmethod
+    def get_covered_attributes(cls, node, attr):
+        attrs = [attr]
+        for child in cmds.attributeQuery(attr, node=node, listChildren=True) or list():
+            attrs += cls.get_covered_attributes(node, child)
+        return attrs
+
+    @classmethod
+    def is_close(cls, a, b, tolerance):
+        if isinstance(a, list) and isinstance(b, list):
+            if len(a) != len(b):
+                return False
+            for item_a, item_b in zip(a, b):
+                if not cls.is_close(item_a, item_b, tolerance):
+                    return False
+            return True
+        if isinstance(a, numbers.Number) and isinstance(b, numbers.Number):
+            return abs(a - b) <= tolerance
+        return a == b
+
+    @classmethod
+    def get_key(cls, record):
+        return record[0], record[1]
+
+    @classmethod
+    def diff(cls, a, b, tolerance=1e-6):
+        a = iter(a)
+        b = iter(b)
+        record_a = next(a, None)
+        record_b = next(b, None)
+        while record_a is not None or record_b is not None:
+            if record_b is None or (record_a is not None and cls.get_key(record_a) < cls.get_key(record_b)):
+                yield f_attr(*cls.get_key(record_a)), cls.removed, None, None
+                record_a = next(a, None)
+            elif record_a is None or cls.get_key(record_b) < cls.get_key(record_a):
+                yield f_attr(*cls.get_key(record_b)), cls.added, None, None
+                record_b = next(b, None)
+            else:
+                for index, field in enumerate(cls.fields, 2):
+                    if not cls.is_close(record_a[index], record_b[index], tolerance):
+                        yield f_attr(*cls.get_key(record_a)), field, record_a[index], record_b[index]
+                record_a = next(a, None)
+                record_b = next(b, None)
+
+    def get_path(self):
+        return self.__path
+
+    def exists(self):
+        return os.path.exists(self.get_path())
+
+    def write(self, nodes):
+        count = 0
+        temp_path = '{0}.tmp'.format(self.get_path())
+        try:
+            with open(temp_path, 'w') as f:
+                for record in self.iter_scene(nodes):
+                    f.write(json.dumps(record, separators=(',', ':')))
+                    f.write('\n')
+                    count += 1
+            # os.rename only replaces an existing file in place on posix.
+            if os.name == 'nt' and self.exists():
+                os.remove(self.get_path())
+            os.rename(temp_path, self.get_path())
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return count
+
+    def read(self):
+        if not self.exists():
+            cmds.error('\'{0}\' does not exist.'.format(self.get_path()))
+
+        previous_key = None
+        with open(self.get_path(), 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if not isinstance(record, list) or len(record) != len(self.fields) + 2:
+                    cmds.error('\'{0}\' line {1}: not a valid {2} record.'.format(self.get_path(), line_number, self.__class__.__name__))
+                key = self.get_key(record)
+                if previous_key is not None and key <= previous_key:
+                    cmds.error('\'{0}\' line {1}: records are not sorted by node and attribute.'.format(self.get_path(), line_number))
+                previous_key = key
+                yield record
+
+    def read_nodes(self):
+        for node, _ in itertools.groupby(self.read(), key=lambda record: record[0]):
+            yield node
+
+    def iter_scene_from_file(self, nodes):
+        # Query the scene for every node of the file, plus the given nodes the file does not know about.
+        listed = sorted(node for node in set(nodes) if cmds.objExists(node))
+        index = 0
+        for node in self.read_nodes():
+            while index < len(listed) and listed[index] < node:
+                for record in self.iter_node(listed[index]):
+                    yield record
+                index += 1
+            if index < len(listed) and listed[index] == node:
+                index += 1
+            if cmds.objExists(node):
+                for record in self.iter_node(node):
+                    yield record
+        for node in listed[index:]:
+            for record in self.iter_node(node):
+                yield record
+
+    def diff_file(self, other, tolerance=1e-6):
+        return self.diff(self.read(), other.read(), tolerance=tolerance)
+
+    def diff_scene(self, nodes, tolerance=1e-6):
+        return self.diff(self.read(), self.iter_scene_from_file(nodes), tolerance=tolerance)
+
+
 class Chunk(object):
 
     def __enter__(self):
@@ -262,6 +262,11 @@ class AttributeEditorPlus(QDialog):
         selection_menu.addAction(create_action('Select Children', self.select_children, self))
         selection_menu.addAction(create_action('Select All Descendents', self.select_all_descendents, self))
 
+        snapshot_menu = self.menu_bar.addMenu('Snapshot')
+        snapshot_menu.addAction(create_action('Export Snapshot', self.export_snapshot, self))
+        snapshot_menu.addAction(create_action('Diff Snapshots', self.diff_snapshots, self))
+        snapshot_menu.addAction(create_action('Diff Snapshot Against Scene', self.diff_snapshot_against_scene, self))
+
         for selection in self.selection_file.get_recent():
             action = create_action(list_to_label(selection, limit=50), lambda x=selection: self.select(x), self)
             recently_selected_menu.addAction(action)
@@ -278,8 +283,7 @@ class AttributeEditorPlus(QDialog):
         attrs_dict = collections.OrderedDict()
         nodes = self.get_selected_nodes()
         for node in nodes:
-            attrs = (cmds.listAttr(node, cb=True) or list()) + (cmds.listAttr(node, k=True) or list())
-            for attr in attrs:
+            for attr in core.list_attributes(node):
                 full = core.f_attr(node, attr)
                 if core.Attribute.is_one(full):
                     if attr not in attrs_dict:
@@ -347,6 +351,53 @@ class AttributeEditorPlus(QDialog):
         self.selection_file.add_saved([core.randomString(stringLength=8), self.get_selected()])
         self.refresh_menu_bar()
 
+    def get_snapshot_file(self, caption, save=False):
+        if save:
+            path = QFileDialog.getSaveFileName(self, caption, filter='Snapshot (*.jsonl)')[0]
+        else:
+            path = QFileDialog.getOpenFileName(self, caption, filter='Snapshot (*.jsonl)')[0]
+        if not path:
+            return None
+        return core.SnapshotFile(path)
+
+    def export_snapshot(self):
+        snapshot_file = self.get_snapshot_file('Export Snapshot', save=True)
+        if snapshot_file is None:
+            return
+        count = snapshot_file.write(self.get_listed_nodes())
+        print '{0}: {1} attributes exported to \'{2}\'.'.format(self.__class__.__name__, count, snapshot_file.get_path())
+
+    def diff_snapshots(self):
+        snapshot_file_a = self.get_snapshot_file('Diff Snapshots: Old')
+        if snapshot_file_a is None:
+            return
+        snapshot_file_b = self.get_snapshot_file('Diff Snapshots: New')
+        if snapshot_file_b is None:
+            return
+        self.write_diff(snapshot_file_b, snapshot_file_a.diff_file(snapshot_file_b))
+
+    def diff_snapshot_against_scene(self):
+        snapshot_file = self.get_snapshot_file('Diff Snapshot Against Scene')
+        if snapshot_file is None:
+            return
+        self.write_diff(snapshot_file, snapshot_file.diff_scene(self.get_listed_nodes()))
+
+    def write_diff(self, snapshot_file, differences):
+        default_path = '{0}.diff.txt'.format(snapshot_file.get_path())
+        path = QFileDialog.getSaveFileName(self, 'Save Diff', default_path, filter='Diff (*.txt)')[0]
+        if not path:
+            return
+
+        count = 0
+        with open(path, 'w') as f:
+            for attr, field, old, new in differences:
+                if field in (core.SnapshotFile.added, core.SnapshotFile.removed):
+                    f.write('{0}: {1}\n'.format(attr, field))
+                else:
+                    f.write('{0}: {1} {2} -> {3}\n'.format(attr, field, format_value(old), format_value(new)))
+                count += 1
+        print '{0}: {1} difference(s) written to \'{2}\'.'.format(self.__class__.__name__, count, path)
+
     def get_listed_nodes(self):
         nodes = list()
         iterator = QTreeWidgetItemIterator(self.nodes_tree)